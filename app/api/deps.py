@@ -3,8 +3,9 @@ from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from sqlalchemy.orm import Session
 from app.db.session import get_db
 from app.services.keycloak_service import keycloak_service
-from app.core.keycloak_config import keycloak_config
-from typing import Optional, Dict, Any
+from app.services.pdf_generator import PDFGenerator
+from typing import Dict, Any
+from functools import lru_cache
 
 security = HTTPBearer()
 
@@ -55,4 +56,9 @@ def get_user_id_from_token(current_user: Dict[str, Any] = Depends(get_current_us
 
 def get_user_roles_from_token(current_user: Dict[str, Any] = Depends(get_current_user)) -> list:
     """Extraire les rôles utilisateur du token"""
-    return current_user.get('roles', []) 
\ No newline at end of file
+    return current_user.get('roles', [])
+
+@lru_cache
+def get_pdf_generator() -> PDFGenerator:
+    """Fournir le générateur de certificats partagé, créé au premier appel"""
+    return PDFGenerator()
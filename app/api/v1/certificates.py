@@ -1,3 +1,4 @@
+import uuid
 from fastapi import APIRouter, Depends, HTTPException, status
 from fastapi.responses import FileResponse
 from sqlalchemy.orm import Session
@@ -5,18 +6,17 @@ from app.db.session import get_db
 from app.crud.stock_repository import get_stock
 from app.crud.user_repository import get_user
 from app.services.pdf_generator import PDFGenerator
-from app.api.deps import get_current_user, get_current_admin
+from app.api.deps import get_current_user, get_pdf_generator
 from app.core.role import Role
-import os
 
 router = APIRouter()
-pdf_generator = PDFGenerator()
 
 @router.get("/generate/{stock_id}")
 def generate_certificate(
-    stock_id: str,
+    stock_id: uuid.UUID,
     db: Session = Depends(get_db),
-    current_user = Depends(get_current_user)
+    current_user = Depends(get_current_user),
+    pdf_generator: PDFGenerator = Depends(get_pdf_generator)
 ):
     stock = get_stock(db, stock_id)
     if not stock:
@@ -48,9 +48,10 @@ def generate_certificate(
 
 @router.get("/download/{stock_id}")
 def download_certificate(
-    stock_id: str,
+    stock_id: uuid.UUID,
     db: Session = Depends(get_db),
-    current_user = Depends(get_current_user)
+    current_user = Depends(get_current_user),
+    pdf_generator: PDFGenerator = Depends(get_pdf_generator)
 ):
     """Télécharge un certificat PDF"""
     stock = get_stock(db, stock_id)
@@ -63,14 +64,15 @@ def download_certificate(
             detail="Not enough permissions"
         )
     
-    if not stock.certificat_path or not os.path.exists(stock.certificat_path):
+    certificate_path = pdf_generator.get_certificate_path(stock)
+    if certificate_path is None:
         raise HTTPException(
             status_code=404,
             detail="Certificat non trouvé. Veuillez d'abord le générer."
         )
     
     return FileResponse(
-        stock.certificat_path,
+        certificate_path,
         media_type='application/pdf',
         filename=f"certificate_{stock_id}.pdf"
     ) 
\ No newline at end of file
@@ -1,3 +1,4 @@
+import uuid
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.orm import Session
 from typing import List
@@ -7,7 +8,7 @@ from app.crud.stock_repository import (
     get_total_stocks_by_shareholder, get_total_stocks
 )
 from app.crud.user_repository import get_user
-from app.schemas.stock import Stock, StockCreate, StockWithShareholder
+from app.schemas.stock import Stock, StockCreate
 from app.api.deps import get_current_admin, get_current_shareholder, get_current_user
 from app.core.role import Role
 
@@ -66,7 +67,7 @@ def read_total_stocks(
 
 @router.get("/{stock_id}", response_model=Stock)
 def read_stock(
-    stock_id: str,
+    stock_id: uuid.UUID,
     db: Session = Depends(get_db),
     current_user = Depends(get_current_user)
 ):
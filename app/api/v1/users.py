@@ -1,3 +1,4 @@
+import uuid
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.orm import Session
 from ...core.permission import permission
@@ -6,7 +7,6 @@ from app.db.session import get_db
 from app.crud.user_repository import get_users, get_user, create_user, get_shareholders, get_user_by_email
 from app.schemas.user import User, UserCreate
 from app.api.deps import get_current_admin, get_current_user
-from app.core.role import Role
 
 router = APIRouter()
 
@@ -53,7 +53,7 @@ def create_new_user(
 @router.get("/{user_id}", response_model=User)
 @permission.hasPermission(role="ROLE_ACTIONNAIRE")
 def read_user(
-    user_id: str,
+    user_id: uuid.UUID,
     db: Session = Depends(get_db),
     current_user = Depends(get_current_admin)
 ):
@@ -1,5 +1,4 @@
 from pydantic import BaseModel
-from typing import Optional
 import os
 from dotenv import load_dotenv
 
@@ -1,9 +1,6 @@
-import uuid
-from enum import Enum
-from sqlalchemy import Column, String, Enum as SqlEnum, ForeignKey, DateTime, Integer
+from sqlalchemy import Column, ForeignKey
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
-from datetime import datetime
 from app.db.session import Base
 
 class Shareholder(Base):
@@ -1,6 +1,5 @@
 import uuid
-from enum import Enum
-from sqlalchemy import Column, String, Enum as SqlEnum, ForeignKey, DateTime, Integer
+from sqlalchemy import Column, String, ForeignKey, DateTime, Integer
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 from datetime import datetime
@@ -1,5 +1,4 @@
 import logging
-from sqlalchemy.orm import Session
 from app.db.session import engine
 from app.db.session import SessionLocal
 from app.crud.user_repository import create_user, get_user_by_email
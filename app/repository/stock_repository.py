@@ -1,3 +1,4 @@
+import uuid
 from sqlalchemy.orm import Session
 from app.database.stock import Stock
 from app.schemas.stock import StockCreate, StockUpdate
@@ -6,8 +7,8 @@ from sqlalchemy import func
 
 
 
-def get_stock(db: Session, stock_id: str) -> Optional[Stock]:
-    return db.query(Stock).filter(Stock.id == stock_id).first()
+def get_stock(db: Session, stock_id: uuid.UUID) -> Optional[Stock]:
+    return db.get(Stock, stock_id)
 
 def get_stocks(db: Session, skip: int = 0, limit: int = 100) -> List[Stock]:
     return db.query(Stock).offset(skip).limit(limit).all()
@@ -16,16 +17,16 @@ def get_stocks_by_shareholder(db: Session, shareholder_id: str, skip: int = 0, l
     return db.query(Stock).filter(Stock.shareholder_id == shareholder_id).offset(skip).limit(limit).all()
 
 def create_stock(db: Session, stock: StockCreate) -> Stock:
-    db_stock = Stock(**stock.dict())
+    db_stock = Stock(**stock.model_dump())
     db.add(db_stock)
     db.commit()
     db.refresh(db_stock)
     return db_stock
 
-def update_stock(db: Session, stock_id: str, stock: StockUpdate) -> Optional[Stock]:
+def update_stock(db: Session, stock_id: uuid.UUID, stock: StockUpdate) -> Optional[Stock]:
     db_stock = get_stock(db, stock_id)
     if db_stock:
-        update_data = stock.dict(exclude_unset=True)
+        update_data = stock.model_dump(exclude_unset=True)
         for field, value in update_data.items():
             setattr(db_stock, field, value)
         db.commit()
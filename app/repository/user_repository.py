@@ -1,12 +1,13 @@
+import uuid
 from sqlalchemy.orm import Session
 from app.database.users import User
-from app.schemas.user import UserCreate, UserUpdate
+from app.schemas.user import UserCreate
 from app.core.security import get_password_hash, verify_password
 from app.core.role import Role
 from typing import Optional
 
-def get_user(db: Session, user_id: str) -> Optional[User]:
-    return db.query(User).filter(User.id == user_id).first()
+def get_user(db: Session, user_id: uuid.UUID) -> Optional[User]:
+    return db.get(User, user_id)
 
 def get_user_by_email(db: Session, email: str) -> Optional[User]:
     return db.query(User).filter(User.email == email).first()
@@ -1,10 +1,11 @@
+import uuid
 from pydantic import BaseModel
 from typing import Optional
 from datetime import datetime
 
 class StockBase(BaseModel):
     nombre: int
-    shareholder_id: str
+    shareholder_id: uuid.UUID
 
 class StockCreate(StockBase):
     pass
@@ -14,7 +15,7 @@ class StockUpdate(BaseModel):
     certificat_path: Optional[str] = None
 
 class Stock(StockBase):
-    id: str
+    id: uuid.UUID
     date_emission: datetime
     certificat_path: Optional[str] = None
 
@@ -1,3 +1,4 @@
+import uuid
 from pydantic import BaseModel, EmailStr
 from typing import Optional
 from datetime import datetime
@@ -16,7 +17,7 @@ class UserUpdate(BaseModel):
     email: Optional[EmailStr] = None
 
 class User(UserBase):
-    id: str
+    id: uuid.UUID
     created_at: datetime
     updated_at: datetime
 
@@ -1,6 +1,12 @@
 import os
+import asyncio
+import multiprocessing
+from io import BytesIO
+from pathlib import Path
 from datetime import datetime
-from reportlab.lib.pagesizes import letter, A4
+from typing import BinaryIO, Dict, List, Optional, Tuple
+from concurrent.futures import ProcessPoolExecutor
+from reportlab.lib.pagesizes import A4
 from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
 from reportlab.lib.units import inch
@@ -10,75 +16,160 @@ from app.core.config import settings
 from app.database.stock import Stock
 from app.database.users import User
 
+_STYLES = getSampleStyleSheet()
+_TITLE_STYLE = ParagraphStyle(
+    'CustomTitle',
+    parent=_STYLES['Heading1'],
+    fontSize=24,
+    spaceAfter=30,
+    alignment=1
+)
+_NORMAL_STYLE = _STYLES['Normal']
+
+_INFO_COL_WIDTHS = [2*inch, 4*inch]
+_INFO_TABLE_STYLE = TableStyle([
+    ('BACKGROUND', (0, 0), (0, -1), colors.grey),
+    ('TEXTCOLOR', (0, 0), (0, -1), colors.whitesmoke),
+    ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+    ('FONTNAME', (0, 0), (-1, -1), 'Helvetica-Bold'),
+    ('FONTSIZE', (0, 0), (-1, -1), 12),
+    ('BOTTOMPADDING', (0, 0), (-1, -1), 12),
+    ('BACKGROUND', (1, 0), (1, -1), colors.beige),
+    ('GRID', (0, 0), (-1, -1), 1, colors.black)
+])
+
+_WATERMARK_TEXT = "CERTIFICAT OFFICIEL"
+
+# Les processus de rendu sont lancés avec spawn: un fork depuis le serveur
+# (multithreadé) pourrait hériter de verrous tenus par d'autres threads
+_BULK_MP_CONTEXT = multiprocessing.get_context("spawn")
+# Démarrer un pool coûte environ 0,3 s contre quelques millisecondes par
+# certificat: en dessous de ce seuil, le rendu reste dans le processus courant
+_BULK_POOL_MIN_ITEMS = 200
+
+CERTIFICATE_FILENAME_TEMPLATE = "certificate_{}_{:%Y%m%d_%H%M%S}.pdf"
+CERTIFICATE_TEXT_TEMPLATE = (
+    "Ce certificat atteste que {name} possède {nombre} action(s) "
+    "émise(s) le {date_emission}. "
+    "Ce document est généré automatiquement et constitue une preuve de propriété."
+)
+
 class PDFGenerator:
     def __init__(self):
         self.certificates_dir = settings.CERTIFICATES_DIR
-        os.makedirs(self.certificates_dir, exist_ok=True)
+        self.certificates_path = Path(self.certificates_dir)
+        self.certificates_path.mkdir(parents=True, exist_ok=True)
     
     def generate_certificate(self, stock: Stock, shareholder: User) -> str:
         """Génère un certificat PDF pour une action"""
-        filename = f"certificate_{stock.id}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.pdf"
-        filepath = os.path.join(self.certificates_dir, filename)
-        
-        doc = SimpleDocTemplate(filepath, pagesize=A4)
-        story = []
-        
-        styles = getSampleStyleSheet()
-        title_style = ParagraphStyle(
-            'CustomTitle',
-            parent=styles['Heading1'],
-            fontSize=24,
-            spaceAfter=30,
-            alignment=1
-        )
+        filepath = self._certificate_filepath(stock)
+        context = _certificate_context(stock, shareholder)
         
-        normal_style = styles['Normal']
-        
-        title = Paragraph("CERTIFICAT D'ACTIONS", title_style)
-        story.append(title)
-        story.append(Spacer(1, 20))
-        
-        shareholder_info = [
-            ["Nom:", shareholder.name],
-            ["Email:", shareholder.email],
-            ["Date d'émission:", stock.date_emission.strftime("%d/%m/%Y")],
-            ["Nombre d'actions:", str(stock.nombre)],
-            ["ID de l'action:", str(stock.id)]
-        ]
-        
-        t = Table(shareholder_info, colWidths=[2*inch, 4*inch])
-        t.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (0, -1), colors.grey),
-            ('TEXTCOLOR', (0, 0), (0, -1), colors.whitesmoke),
-            ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-            ('FONTNAME', (0, 0), (-1, -1), 'Helvetica-Bold'),
-            ('FONTSIZE', (0, 0), (-1, -1), 12),
-            ('BOTTOMPADDING', (0, 0), (-1, -1), 12),
-            ('BACKGROUND', (1, 0), (1, -1), colors.beige),
-            ('GRID', (0, 0), (-1, -1), 1, colors.black)
-        ]))
-        
-        story.append(t)
-        story.append(Spacer(1, 30))
-        
-        cert_text = f"""
-        Ce certificat atteste que {shareholder.name} possède {stock.nombre} action(s) 
-        émise(s) le {stock.date_emission.strftime("%d/%m/%Y")}.
-        
-        Ce document est généré automatiquement et constitue une preuve de propriété.
-        """
+        return _render_certificate_file(filepath, context)
+    
+    def write_certificate(self, stock: Stock, shareholder: User, output_stream: BinaryIO) -> None:
+        """Écrit un certificat PDF dans un flux binaire ouvert en écriture"""
+        _render_certificate(output_stream, _certificate_context(stock, shareholder))
+    
+    def generate_certificates_bulk(self, items: List[Tuple[Stock, User]]) -> List[str]:
+        """Génère les certificats de plusieurs actions, sur plusieurs processus pour les gros lots"""
+        if not items:
+            return []
         
-        cert_paragraph = Paragraph(cert_text, normal_style)
-        story.append(cert_paragraph)
+        stock_ids = [stock.id for stock, _ in items]
+        if len(set(stock_ids)) != len(stock_ids):
+            raise ValueError("Chaque action ne peut apparaître qu'une fois par génération groupée")
         
-        doc.build(story)
+        filepaths = [self._certificate_filepath(stock) for stock, _ in items]
+        contexts = [_certificate_context(stock, shareholder) for stock, shareholder in items]
         
-        self._add_watermark(filepath)
+        try:
+            if len(items) < _BULK_POOL_MIN_ITEMS:
+                return [_render_certificate_file(path, context) for path, context in zip(filepaths, contexts)]
+            
+            max_workers = min(len(items), os.cpu_count() or 1)
+            with ProcessPoolExecutor(max_workers=max_workers, mp_context=_BULK_MP_CONTEXT) as executor:
+                return list(executor.map(_render_certificate_file, filepaths, contexts))
+        except Exception:
+            # Un échec annule tout le lot: l'appelant ne reçoit aucun chemin,
+            # les fichiers déjà écrits ne doivent donc pas rester orphelins
+            for filepath in filepaths:
+                Path(filepath).unlink(missing_ok=True)
+            raise
+    
+    def get_certificate_path(self, stock: Stock) -> Optional[str]:
+        """Retourne le chemin du certificat d'une action s'il existe sur disque"""
+        if not stock.certificat_path or not os.path.exists(stock.certificat_path):
+            return None
+        return stock.certificat_path
+    
+    async def generate_certificate_async(self, stock: Stock, shareholder: User) -> str:
+        """Génère un certificat PDF dans un thread pour ne pas bloquer la boucle d'événements"""
+        filepath = self._certificate_filepath(stock)
+        context = _certificate_context(stock, shareholder)
         
-        return filepath
+        return await asyncio.to_thread(_render_certificate_file, filepath, context)
+    
+    def _certificate_filepath(self, stock: Stock) -> str:
+        """Construit le chemin du fichier PDF d'un certificat"""
+        filename = CERTIFICATE_FILENAME_TEMPLATE.format(stock.id, datetime.now())
+        return str(self.certificates_path / filename)
+
+
+def _certificate_context(stock: Stock, shareholder: User) -> Dict[str, str]:
+    """Extrait les champs affichés sur le certificat sous une forme sérialisable"""
+    return {
+        "name": shareholder.name,
+        "email": shareholder.email,
+        "date_emission": stock.date_emission.strftime("%d/%m/%Y"),
+        "nombre": str(stock.nombre),
+        "stock_id": str(stock.id),
+    }
+
+def _render_certificate(target: BinaryIO, context: Dict[str, str]) -> None:
+    """Met en page le certificat et écrit le PDF dans le flux fourni"""
+    doc = SimpleDocTemplate(target, pagesize=A4)
+    story = []
     
-    def _add_watermark(self, filepath: str):
-        """Ajoute un filigrane au PDF"""
-        # Cette fonction peut être implémentée pour ajouter un filigrane
-        # Pour l'instant, on laisse vide
-        pass 
\ No newline at end of file
+    title = Paragraph("CERTIFICAT D'ACTIONS", _TITLE_STYLE)
+    story.append(title)
+    story.append(Spacer(1, 20))
+    
+    shareholder_info = [
+        ["Nom:", context["name"]],
+        ["Email:", context["email"]],
+        ["Date d'émission:", context["date_emission"]],
+        ["Nombre d'actions:", context["nombre"]],
+        ["ID de l'action:", context["stock_id"]]
+    ]
+    
+    t = Table(shareholder_info, colWidths=_INFO_COL_WIDTHS)
+    t.setStyle(_INFO_TABLE_STYLE)
+    
+    story.append(t)
+    story.append(Spacer(1, 30))
+    
+    cert_paragraph = Paragraph(CERTIFICATE_TEXT_TEMPLATE.format_map(context), _NORMAL_STYLE)
+    story.append(cert_paragraph)
+    
+    doc.build(story, onFirstPage=_draw_watermark, onLaterPages=_draw_watermark)
+
+def _render_certificate_file(filepath: str, context: Dict[str, str]) -> str:
+    """Écrit un certificat sur disque; le fichier n'est créé qu'une fois le rendu réussi"""
+    buffer = BytesIO()
+    _render_certificate(buffer, context)
+    with open(filepath, 'wb') as output_stream:
+        output_stream.write(buffer.getvalue())
+    return filepath
+
+def _draw_watermark(pdf_canvas: canvas.Canvas, doc: SimpleDocTemplate) -> None:
+    """Dessine le filigrane sur la page en cours de rendu"""
+    width, height = doc.pagesize
+    pdf_canvas.saveState()
+    pdf_canvas.setFillColor(colors.grey)
+    pdf_canvas.setFillAlpha(0.15)
+    pdf_canvas.setFont('Helvetica-Bold', 60)
+    pdf_canvas.translate(width / 2, height / 2)
+    pdf_canvas.rotate(45)
+    pdf_canvas.drawCentredString(0, 0, _WATERMARK_TEXT)
+    pdf_canvas.restoreState()
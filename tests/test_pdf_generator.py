@@ -0,0 +1,140 @@
+import asyncio
+import os
+import uuid
+from datetime import datetime
+from types import SimpleNamespace
+from unittest.mock import MagicMock, call, patch
+
+import pytest
+from reportlab.lib.pagesizes import A4
+
+from app.core.config import settings
+from app.services import pdf_generator
+from app.services.pdf_generator import PDFGenerator
+
+
+@pytest.fixture
+def generator(tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "CERTIFICATES_DIR", str(tmp_path))
+    return PDFGenerator()
+
+
+@pytest.fixture
+def stock():
+    return SimpleNamespace(
+        id=uuid.uuid4(),
+        nombre=100,
+        date_emission=datetime(2024, 1, 1),
+        certificat_path=None,
+    )
+
+
+@pytest.fixture
+def shareholder():
+    return SimpleNamespace(name="Jean Dupont", email="jean@example.com")
+
+
+def test_generate_certificate_async_writes_pdf(generator, stock, shareholder):
+    filepath = asyncio.run(generator.generate_certificate_async(stock, shareholder))
+
+    with open(filepath, "rb") as f:
+        assert f.read(4) == b"%PDF"
+
+
+def test_generate_certificate_render_error_leaves_no_file(generator, stock, tmp_path):
+    shareholder = SimpleNamespace(name="A <b> B", email="a@example.com")
+
+    with pytest.raises(ValueError):
+        generator.generate_certificate(stock, shareholder)
+
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_generate_certificate_async_render_error_leaves_no_file(generator, stock, tmp_path):
+    shareholder = SimpleNamespace(name="A <b> B", email="a@example.com")
+
+    with pytest.raises(ValueError):
+        asyncio.run(generator.generate_certificate_async(stock, shareholder))
+
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_get_certificate_path_returns_generated_file(generator, stock, shareholder):
+    stock.certificat_path = generator.generate_certificate(stock, shareholder)
+
+    assert generator.get_certificate_path(stock) == stock.certificat_path
+
+
+def test_get_certificate_path_after_file_deleted(generator, stock, shareholder):
+    stock.certificat_path = generator.generate_certificate(stock, shareholder)
+    assert generator.get_certificate_path(stock) == stock.certificat_path
+
+    os.remove(stock.certificat_path)
+
+    assert generator.get_certificate_path(stock) is None
+
+
+def test_get_certificate_path_without_path(generator, stock):
+    assert generator.get_certificate_path(stock) is None
+
+
+def test_generate_certificates_bulk_uses_process_pool(generator, stock, shareholder, monkeypatch):
+    other = SimpleNamespace(id=uuid.uuid4(), nombre=5, date_emission=datetime(2024, 1, 2))
+    monkeypatch.setattr(pdf_generator, "_BULK_POOL_MIN_ITEMS", 2)
+
+    with patch("app.services.pdf_generator.ProcessPoolExecutor") as executor_cls:
+        executor = executor_cls.return_value.__enter__.return_value
+        executor.map.side_effect = lambda func, paths, contexts: list(paths)
+
+        paths = generator.generate_certificates_bulk([(stock, shareholder), (other, shareholder)])
+
+    assert executor_cls.call_args.kwargs["max_workers"] == min(2, os.cpu_count() or 1)
+    executor.map.assert_called_once()
+    assert executor.map.call_args.args[0] is pdf_generator._render_certificate_file
+    assert len(paths) == 2
+    assert str(stock.id) in paths[0]
+    assert str(other.id) in paths[1]
+
+
+def test_generate_certificates_bulk_small_batch_renders_in_process(generator, stock, shareholder):
+    other = SimpleNamespace(id=uuid.uuid4(), nombre=5, date_emission=datetime(2024, 1, 2))
+
+    with patch("app.services.pdf_generator.ProcessPoolExecutor") as executor_cls:
+        paths = generator.generate_certificates_bulk([(stock, shareholder), (other, shareholder)])
+
+    executor_cls.assert_not_called()
+    assert len(paths) == 2
+    for path in paths:
+        with open(path, "rb") as f:
+            assert f.read(4) == b"%PDF"
+
+
+def test_generate_certificates_bulk_failure_removes_written_files(generator, stock, shareholder, tmp_path):
+    other = SimpleNamespace(id=uuid.uuid4(), nombre=5, date_emission=datetime(2024, 1, 2))
+    broken = SimpleNamespace(name="A <b> B", email="a@example.com")
+
+    with pytest.raises(ValueError):
+        generator.generate_certificates_bulk([(stock, shareholder), (other, broken)])
+
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_generate_certificates_bulk_rejects_duplicate_stocks(generator, stock, shareholder):
+    with pytest.raises(ValueError):
+        generator.generate_certificates_bulk([(stock, shareholder), (stock, shareholder)])
+
+
+def test_generate_certificates_bulk_empty(generator):
+    assert generator.generate_certificates_bulk([]) == []
+
+
+def test_draw_watermark_draws_translucent_text_in_isolated_state():
+    pdf_canvas = MagicMock()
+
+    pdf_generator._draw_watermark(pdf_canvas, SimpleNamespace(pagesize=A4))
+
+    pdf_canvas.setFillAlpha.assert_called_once_with(0.15)
+    pdf_canvas.drawCentredString.assert_called_once_with(0, 0, "CERTIFICAT OFFICIEL")
+    calls = pdf_canvas.method_calls
+    assert calls[0] == call.saveState()
+    assert calls[-1] == call.restoreState()